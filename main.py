@@ -1,119 +1,489 @@
 import pandas as pd
 import numpy as np
+import json
+import os
 import sys
+from functools import lru_cache
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# CSV inputs larger than this are scored in chunks of STREAMING_CHUNK_ROWS rows
+STREAMING_THRESHOLD_BYTES = 1 << 30
+STREAMING_CHUNK_ROWS = 1_000_000
+
+# Decision matrices larger than this are scored on the GPU when CuPy is available
+GPU_THRESHOLD_BYTES = 50_000_000
+
+# Loading Numba's cached kernel costs ~0.3 s; NumPy wins below ~80 MB (measured
+# on one core, so the parallel kernel may break even earlier on more)
+JIT_THRESHOLD_BYTES = 100_000_000
+
+def read_excel_cached(file_path):
+    """Read an Excel file, reusing a Parquet copy saved next to it when fresh.
+
+    The copy records the workbook's size and modification time and is used
+    only when both still match exactly, so replacing the workbook with an
+    older file is noticed too. Parquet stores column names as strings, so the
+    original header values are kept alongside and restored on a cache hit;
+    headers JSON can't represent (e.g. dates) skip the cache.
+    """
+    if pyarrow is None:
+        return pd.read_excel(file_path)
+
+    source_stat = os.stat(file_path)
+    source_key = f"{source_stat.st_size}:{source_stat.st_mtime_ns}".encode()
+
+    cache_path = file_path + '.parquet'
+    try:
+        cache_metadata = pyarrow.parquet.read_schema(cache_path).metadata or {}
+        if cache_metadata.get(b'topsis_source') == source_key:
+            data = pyarrow.parquet.read_table(cache_path).to_pandas()
+            data.columns = json.loads(cache_metadata[b'topsis_columns'])
+            return data
+    except (OSError, KeyError, ValueError, pyarrow.ArrowException):
+        # No cache yet, or an unreadable one that gets rewritten below
+        pass
+
+    data = pd.read_excel(file_path, engine='openpyxl')
+    column_names = list(data.columns)
+    if not all(type(name) in (str, int, float) for name in column_names):
+        return data
+    try:
+        table = pyarrow.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b'topsis_source': source_key,
+            b'topsis_columns': json.dumps(column_names).encode(),
+        })
+        pyarrow.parquet.write_table(table, cache_path, compression='zstd')
+    except (OSError, pyarrow.ArrowException):
+        # The cache is only an optimization; a read-only directory or a column
+        # Arrow can't store shouldn't stop the run
+        pass
+    return data
 
 def load_data(file_path):
     """Load data from a CSV or Excel file."""
     if file_path.endswith('.xlsx'):
-        return pd.read_excel(file_path)
+        return read_excel_cached(file_path)
     elif file_path.endswith('.csv'):
+        # The pyarrow engine parses with multiple threads when it is installed
+        if pyarrow is not None:
+            data = pd.read_csv(file_path, engine='pyarrow')
+            # Unlike the C engine, pyarrow keeps repeated header names as they
+            # are; re-read so they get the usual '.1' suffixes
+            if data.columns.is_unique:
+                return data
         return pd.read_csv(file_path)
     else:
         raise ValueError("File must be in .csv or .xlsx format.")
 
-def validate_arguments(file_path, priority_weights, benefit_impacts, output_path):
-    """Validate inputs and check for consistency."""
-    if len(sys.argv) != 5:
-        raise ValueError("Usage: <script.py> <InputFile> <Weights> <Impacts> <OutputFile>")
+def arrow_csv_writable(data):
+    """Whether Arrow's CSV writer renders this table the way the output format expects.
+
+    Arrow is used only for numeric and plain-text columns: it formats booleans
+    and datetimes differently from to_csv, and it is run without quoting, so
+    text containing a delimiter, quote or line break has to go through to_csv.
+    """
+    if pyarrow is None:
+        return False
+
+    for name, column in data.items():
+        if not isinstance(name, str) or any(c in name for c in ',"\r\n'):
+            return False
+        if pd.api.types.is_bool_dtype(column) or not (
+                pd.api.types.is_numeric_dtype(column) or pd.api.types.is_object_dtype(column)
+                or pd.api.types.is_string_dtype(column)):
+            return False
+        if not pd.api.types.is_numeric_dtype(column):
+            if pd.api.types.infer_dtype(column, skipna=False) != 'string':
+                return False
+            if column.str.contains('[,"\r\n]').any():
+                return False
+    return True
+
+def write_output(data, output_path, append=False, use_arrow=None):
+    """Write the results to a CSV file, or to Parquet for a .parquet path.
+
+    CSV output goes through Arrow's multi-threaded writer when
+    arrow_csv_writable allows it, and through to_csv otherwise; pass use_arrow
+    to make that choice for the caller. With append=True the rows are added
+    to an existing CSV file without a header, which lets the streaming path
+    write its output chunk by chunk.
+    """
+    if output_path.endswith('.parquet'):
+        data.to_parquet(output_path, index=False)
+        return
 
+    if use_arrow is None:
+        use_arrow = arrow_csv_writable(data)
+
+    if use_arrow:
+        # Rendering into memory first keeps a failed write out of the file
+        table = pyarrow.Table.from_pandas(data, preserve_index=False)
+        buffer = pyarrow.BufferOutputStream()
+        pyarrow.csv.write_csv(
+            table, buffer,
+            write_options=pyarrow.csv.WriteOptions(
+                include_header=not append, quoting_header='none', quoting_style='none'),
+        )
+        with open(output_path, 'ab' if append else 'wb') as output_file:
+            output_file.write(buffer.getvalue())
+    else:
+        data.to_csv(output_path, mode='a' if append else 'w', header=not append, index=False)
+
+def parse_args(argv=None):
+    """Return the input file, weights, impacts and output file from the command line.
+
+    The arguments are unpacked by position rather than with argparse, which
+    would read a cost-first impacts string such as "-,+,+" as an option.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) != 4:
+        print("Usage: python <script.py> <InputFile> <Weights> <Impacts> <OutputFile>")
+        sys.exit(1)
+    return argv
+
+def _parse_weights_and_impacts(priority_weights, benefit_impacts, criteria_count):
+    """Parse the weight and impact strings and check them against the criteria count."""
+    # Convert weights and impacts to appropriate formats
     try:
-        # Load the input data
-        data = load_data(file_path)
+        priority_weights = np.array([float(w) for w in priority_weights.split(',')], dtype=np.float32)
+    except ValueError:
+        raise ValueError("Weights must be comma-separated numbers.") from None
+    benefit_impacts = np.asarray(benefit_impacts.split(','))
+
+    # Check that weights match the number of criteria columns
+    if len(priority_weights) != criteria_count:
+        raise ValueError("The number of weights must match the number of criteria columns.")
 
-        # Ensure there are at least three columns
-        if len(data.columns) < 3:
-            raise ValueError("The input file must contain at least three columns.")
+    # Check that impacts match the number of criteria columns
+    if len(benefit_impacts) != criteria_count:
+        raise ValueError("The number of impacts must match the number of criteria columns.")
 
-        # Convert weights and impacts to appropriate formats
-        priority_weights = [float(w) for w in priority_weights.split(',')]
-        benefit_impacts = benefit_impacts.split(',')
+    # Validate that impacts are either '+' or '-'
+    if not np.isin(benefit_impacts, ['+', '-']).all():
+        raise ValueError("Impacts must be '+' for benefit or '-' for cost.")
 
-        # Ensure numeric columns contain valid numbers
-        for column in data.columns[1:]:
-            if not pd.to_numeric(data[column], errors='coerce').notnull().all():
-                raise ValueError(f"Column '{column}' contains non-numeric values.")
+    # Benefit criteria ('+') take their ideal at the column max, cost criteria at the min
+    benefit_mask = benefit_impacts == '+'
 
-        # Check that weights match the number of criteria columns
-        if len(priority_weights) != len(data.columns[1:]):
-            raise ValueError("The number of weights must match the number of criteria columns.")
+    return priority_weights, benefit_mask
 
-        # Check that impacts match the number of criteria columns
-        if len(benefit_impacts) != len(data.columns[1:]):
-            raise ValueError("The number of impacts must match the number of criteria columns.")
+def _criteria_block(data):
+    """Return the criteria columns as a float32 block, rejecting non-numeric values."""
+    # Ensure numeric columns contain valid numbers, coercing only if some
+    # column was not already parsed with a numeric dtype
+    criteria_block = data.iloc[:, 1:]
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in criteria_block.dtypes):
+        criteria_block = criteria_block.apply(pd.to_numeric, errors='coerce')
+    invalid_columns = criteria_block.isna().any()
+    if invalid_columns.any():
+        raise ValueError(
+            f"Columns {list(invalid_columns.index[invalid_columns])} contain non-numeric values."
+        )
 
-        # Validate that impacts are either '+' or '-'
-        if not all(impact in ['+', '-'] for impact in benefit_impacts):
-            raise ValueError("Impacts must be '+' for benefit or '-' for cost.")
+    # Convert the validated block once; scores don't need float64 precision
+    with np.errstate(over='ignore'):
+        numerical_data = np.ascontiguousarray(criteria_block.to_numpy(dtype=np.float32))
 
-    except FileNotFoundError:
-        raise FileNotFoundError("Input file not found.")
-    except Exception as error:
-        raise Exception(f"Error validating inputs: {str(error)}")
+    # Infinite values (including ones too large for float32) make every score NaN
+    infinite_columns = ~np.isfinite(numerical_data).all(axis=0)
+    if infinite_columns.any():
+        raise ValueError(
+            f"Columns {list(criteria_block.columns[infinite_columns])} contain infinite values."
+        )
 
-    return data, priority_weights, benefit_impacts
+    return numerical_data
 
-def compute_topsis(data, weights, impacts):
-    """Calculate TOPSIS scores and rankings."""
-    # Extract numerical data
-    numerical_data = data.iloc[:, 1:].values.astype(float)
+def load_and_validate(file_path, priority_weights, benefit_impacts):
+    """Load the input file once and check it against the weights and impacts.
+
+    Returns the loaded data, its criteria columns as a float32 block, the
+    weights as a float32 array and a boolean mask of benefit ('+') criteria.
+    """
+    # Load the input data
+    data = load_data(file_path)
+
+    # Ensure there are at least three columns
+    if len(data.columns) < 3:
+        raise ValueError("The input file must contain at least three columns.")
+
+    numerical_data = _criteria_block(data)
+    priority_weights, benefit_mask = _parse_weights_and_impacts(
+        priority_weights, benefit_impacts, numerical_data.shape[1]
+    )
+
+    return data, numerical_data, priority_weights, benefit_mask
 
-    # Step 1: Normalize the decision matrix
-    normalization_factor = np.sqrt(np.sum(numerical_data**2, axis=0))
-    normalized_data = numerical_data / normalization_factor
+def _separation_scores(weighted_data, ideal_best, ideal_worst, xp=np):
+    """Score rows of a weighted normalized matrix by their distance to the ideals."""
+    # Calculate separation distances as |w|^2 - 2 w.ideal + |ideal|^2, which
+    # avoids building (N, M) difference arrays. Both ideals go through a single
+    # (N, M) @ (M, 2) product; round-off below zero is clipped. The terms
+    # nearly cancel when rows sit close to an ideal, so this step runs in
+    # float64 even for float32 input; float32 loses whole ranks here
+    weighted_data = weighted_data.astype(xp.float64, copy=False)
+    anchors = xp.stack([ideal_best, ideal_worst], axis=1).astype(xp.float64)
+    row_squares = xp.einsum('ij,ij->i', weighted_data, weighted_data)
+    squared_distances = (row_squares[:, None] - 2 * (weighted_data @ anchors)
+                         + xp.einsum('ij,ij->j', anchors, anchors))
+    separation_best, separation_worst = xp.sqrt(xp.maximum(squared_distances, 0)).T
 
-    # Step 2: Calculate the weighted normalized matrix
-    weighted_data = normalized_data * np.array(weights)
+    # Compute TOPSIS scores
+    return separation_worst / (separation_best + separation_worst)
+
+def _topsis_scores_vectorized(numerical_data, weights, benefit_mask, xp=np):
+    """Calculate TOPSIS scores with whole-array operations of the NumPy or CuPy module xp."""
+    # Step 1: Column norms of the decision matrix (einsum avoids a squared temporary).
+    # The matrix is stored as float32, but the arithmetic runs in float64:
+    # rows that differ by a fraction of a percent otherwise swap ranks
+    normalization_factor = xp.sqrt(
+        xp.einsum('ij,ij->j', numerical_data, numerical_data, dtype=xp.float64))
+
+    # Step 2: Normalize and weight in one pass by folding both into a per-column scale
+    scale = weights.astype(xp.float64) / normalization_factor
+    weighted_data = numerical_data * scale
 
     # Step 3: Identify ideal best and worst values
-    ideal_best = np.zeros(len(data.columns) - 1)
-    ideal_worst = np.zeros(len(data.columns) - 1)
+    column_max = weighted_data.max(axis=0)
+    column_min = weighted_data.min(axis=0)
+    ideal_best = xp.where(benefit_mask, column_max, column_min)
+    ideal_worst = xp.where(benefit_mask, column_min, column_max)
+
+    # Steps 4 and 5: Separation distances and scores
+    return _separation_scores(weighted_data, ideal_best, ideal_worst, xp)
+
+@lru_cache(maxsize=None)
+def _load_cupy():
+    """Return the cupy module if it is installed and sees a CUDA device, else None.
+
+    CuPy is imported on first use so runs that never reach the GPU path don't
+    pay for the import or the device query.
+    """
+    try:
+        import cupy
+        if cupy.cuda.runtime.getDeviceCount() == 0:
+            return None
+    except Exception:
+        # CuPy is missing, or installed without a usable CUDA driver
+        return None
+    return cupy
+
+@lru_cache(maxsize=16)
+def _load_topsis_kernel(n_cols):
+    """Return the fused Numba scoring kernel for n_cols criteria, or None if
+    Numba isn't installed.
+
+    Numba is imported on first use so runs that never reach the kernel don't
+    pay for it. The criteria count is a closure constant, so LLVM can unroll
+    and vectorize the per-row loops; Numba keys its on-disk cache on closure
+    values, so cache=True still reuses each specialization across runs.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    # Fast-math without 'nnan'/'ninf': the min/max scans start from +-inf
+    @njit(parallel=True, fastmath={'contract', 'reassoc', 'arcp', 'nsz'}, cache=True)
+    def _topsis_scores_kernel(numerical_data, weights, benefit_mask):
+        """Calculate TOPSIS scores in fused passes over the decision matrix."""
+        n_rows = numerical_data.shape[0]
+        # The matrix may be float32, but the arithmetic runs in float64 so
+        # near-tied rows keep their order
+        scale = np.empty(n_cols, np.float64)
+        ideal_best = np.empty(n_cols, np.float64)
+        ideal_worst = np.empty(n_cols, np.float64)
+        performance_scores = np.empty(n_rows, np.float64)
+
+        # Pass 1: fold each column's norm and weight into one scale and track
+        # the min and max of the weighted values. The weighted matrix itself is
+        # never stored; both passes recompute its entries from the input
+        for j in prange(n_cols):
+            sum_squares = 0.0
+            for i in range(n_rows):
+                sum_squares += numerical_data[i, j] * numerical_data[i, j]
+            scale[j] = weights[j] / np.sqrt(sum_squares)
+
+            column_min = np.inf
+            column_max = -np.inf
+            for i in range(n_rows):
+                value = numerical_data[i, j] * scale[j]
+                column_min = min(column_min, value)
+                column_max = max(column_max, value)
+
+            if benefit_mask[j]:
+                ideal_best[j] = column_max
+                ideal_worst[j] = column_min
+            else:
+                ideal_best[j] = column_min
+                ideal_worst[j] = column_max
+
+        # Pass 2: both separation distances and the score, one row at a time
+        for i in prange(n_rows):
+            separation_best = 0.0
+            separation_worst = 0.0
+            for j in range(n_cols):
+                value = numerical_data[i, j] * scale[j]
+                separation_best += (value - ideal_best[j]) ** 2
+                separation_worst += (value - ideal_worst[j]) ** 2
+            separation_best = np.sqrt(separation_best)
+            separation_worst = np.sqrt(separation_worst)
+            performance_scores[i] = separation_worst / (separation_best + separation_worst)
+
+        return performance_scores
+
+    return _topsis_scores_kernel
 
-    for idx in range(len(data.columns) - 1):
-        if impacts[idx] == '+':
-            ideal_best[idx] = np.max(weighted_data[:, idx])
-            ideal_worst[idx] = np.min(weighted_data[:, idx])
-        else:
-            ideal_best[idx] = np.min(weighted_data[:, idx])
-            ideal_worst[idx] = np.max(weighted_data[:, idx])
+def compute_topsis(numerical_data, weights, benefit_mask):
+    """Calculate TOPSIS scores and rankings."""
+    # Large matrices are copied to the GPU once and only the results come back
+    cp = _load_cupy() if numerical_data.nbytes > GPU_THRESHOLD_BYTES else None
+    if cp is not None:
+        performance_scores = _topsis_scores_vectorized(
+            cp.asarray(numerical_data), cp.asarray(weights), cp.asarray(benefit_mask), cp
+        )
+        rankings = _rank_scores(performance_scores, cp)
+        return performance_scores.astype(cp.float32).get(), rankings.get()
+
+    # Use the fused Numba kernel when the input is big enough to repay loading
+    # it and Numba is available, otherwise fall back to NumPy
+    kernel = None
+    if numerical_data.nbytes >= JIT_THRESHOLD_BYTES:
+        kernel = _load_topsis_kernel(numerical_data.shape[1])
+    if kernel is not None:
+        performance_scores = kernel(numerical_data, weights, benefit_mask)
+    else:
+        performance_scores = _topsis_scores_vectorized(numerical_data, weights, benefit_mask)
+
+    # Rank on the float64 scores; many distinct scores collide once rounded to float32
+    return performance_scores.astype(np.float32), _rank_scores(performance_scores)
+
+def _rank_scores(performance_scores, xp=np):
+    """Rank scores from 1 (best) to N."""
+    # Sort once, then scatter ranks 1..N back to row positions
+    row_count = performance_scores.shape[0]
+    order = xp.argsort(-performance_scores, kind='stable')
+    rankings = xp.empty(row_count, dtype=xp.int64)
+    rankings[order] = xp.arange(1, row_count + 1, dtype=xp.int64)
+    return rankings
+
+def _round_scores(performance_scores):
+    """Round scores to 4 decimals in place so they stay float32."""
+    performance_scores *= np.float32(1e4)
+    np.rint(performance_scores, out=performance_scores)
+    performance_scores /= np.float32(1e4)
+    return performance_scores
+
+def compute_topsis_streaming(input_path, priority_weights, benefit_impacts, output_path,
+                             chunk_rows=STREAMING_CHUNK_ROWS):
+    """Score a CSV file too large for memory in chunks of rows.
 
-    # Step 4: Calculate separation distances
-    separation_best = np.sqrt(np.sum((weighted_data - ideal_best)**2, axis=1))
-    separation_worst = np.sqrt(np.sum((weighted_data - ideal_worst)**2, axis=1))
+    The column norms, minima and maxima are gathered in a first pass, the
+    scores in a second, and the rows are written out with their scores and
+    ranks in a third. Only one chunk of the input is held at a time.
+    """
+    def read_chunks():
+        # Round-trip parsing echoes the input exactly, as the pyarrow engine does
+        return pd.read_csv(input_path, chunksize=chunk_rows, float_precision='round_trip')
 
-    # Step 5: Compute TOPSIS scores
-    performance_scores = separation_worst / (separation_best + separation_worst)
+    # Pass 1: per-column sums of squares, minima and maxima
+    sum_squares = column_min = column_max = None
+    row_count = 0
+    # The CSV writer is chosen once for the whole output, so one chunk that
+    # needs to_csv doesn't leave the file in two formats
+    use_arrow = pyarrow is not None
+    for chunk in read_chunks():
+        if sum_squares is None:
+            if len(chunk.columns) < 3:
+                raise ValueError("The input file must contain at least three columns.")
+            priority_weights, benefit_mask = _parse_weights_and_impacts(
+                priority_weights, benefit_impacts, len(chunk.columns) - 1
+            )
+            sum_squares = np.zeros(len(chunk.columns) - 1)
+            column_min = np.full(len(chunk.columns) - 1, np.inf, dtype=np.float32)
+            column_max = np.full(len(chunk.columns) - 1, -np.inf, dtype=np.float32)
 
-    # Rank the scores
-    rankings = len(performance_scores) - np.argsort(performance_scores).argsort()
+        # A header-only file still yields one empty chunk
+        if chunk.empty:
+            continue
+        row_count += len(chunk)
+        use_arrow = use_arrow and arrow_csv_writable(chunk)
 
-    return performance_scores, rankings
+        block = _criteria_block(chunk)
+        sum_squares += np.einsum('ij,ij->j', block, block, dtype=np.float64)
+        np.minimum(column_min, block.min(axis=0), out=column_min)
+        np.maximum(column_max, block.max(axis=0), out=column_max)
+
+    if row_count == 0:
+        raise ValueError("The input file contains no rows.")
+
+    # Fold normalization and weights into one scale; the weighted extremes are
+    # the scaled raw extremes, swapped where the scale is negative
+    scale = priority_weights.astype(np.float64) / np.sqrt(sum_squares)
+    weighted_max = np.maximum(column_max * scale, column_min * scale)
+    weighted_min = np.minimum(column_max * scale, column_min * scale)
+    ideal_best = np.where(benefit_mask, weighted_max, weighted_min)
+    ideal_worst = np.where(benefit_mask, weighted_min, weighted_max)
+
+    # Pass 2: scores, chunk by chunk
+    performance_scores = np.concatenate([
+        _separation_scores(_criteria_block(chunk) * scale, ideal_best, ideal_worst)
+        for chunk in read_chunks() if not chunk.empty
+    ])
+    rankings = _rank_scores(performance_scores)
+    performance_scores = _round_scores(performance_scores.astype(np.float32))
+
+    # Pass 3: append each chunk with its scores and ranks to the output,
+    # formatted the same way as the in-memory path
+    start = 0
+    for chunk in read_chunks():
+        if chunk.empty:
+            continue
+        stop = start + len(chunk)
+        chunk['Topsis Score'] = performance_scores[start:stop]
+        chunk['Rank'] = rankings[start:stop]
+        write_output(chunk, output_path, append=start > 0, use_arrow=use_arrow)
+        start = stop
 
 def main():
+    input_path, input_weights, input_impacts, output_path = parse_args()
+
+    # Only a missing input gets this message; other FileNotFoundErrors, such
+    # as a missing output directory, report their own
+    if not os.path.exists(input_path):
+        print("Error: Input file not found.")
+        sys.exit(1)
+
     try:
-        # Ensure proper command-line arguments
-        if len(sys.argv) != 5:
-            print("Usage: python <script.py> <InputFile> <Weights> <Impacts> <OutputFile>")
-            sys.exit(1)
-
-        input_path = sys.argv[1]
-        input_weights = sys.argv[2]
-        input_impacts = sys.argv[3]
-        output_path = sys.argv[4]
-
-        # Validate inputs and preprocess the data
-        processed_data, processed_weights, processed_impacts = validate_arguments(
-            input_path, input_weights, input_impacts, output_path
+        # CSV input too large to hold in memory is scored in chunks of rows
+        if (input_path.endswith('.csv') and output_path.endswith('.csv')
+                and os.path.getsize(input_path) > STREAMING_THRESHOLD_BYTES):
+            compute_topsis_streaming(input_path, input_weights, input_impacts, output_path)
+            print(f"Results successfully written to {output_path}")
+            return
+
+        # Read the input once and validate it in memory
+        data, numerical_data, weights, benefit_mask = load_and_validate(
+            input_path, input_weights, input_impacts
         )
 
         # Calculate TOPSIS scores and rankings
-        scores, ranks = compute_topsis(processed_data, processed_weights, processed_impacts)
+        scores, ranks = compute_topsis(numerical_data, weights, benefit_mask)
 
         # Append results to the dataframe
-        processed_data['Topsis Score'] = scores.round(4)
-        processed_data['Rank'] = ranks
+        data['Topsis Score'] = _round_scores(scores)
+        data['Rank'] = ranks
 
         # Save the results to the specified output file
-        processed_data.to_csv(output_path, index=False)
+        write_output(data, output_path)
         print(f"Results successfully written to {output_path}")
 
     except Exception as error:
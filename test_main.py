@@ -0,0 +1,174 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from main import (
+    _load_topsis_kernel, _rank_scores, _round_scores, _topsis_scores_vectorized,
+    arrow_csv_writable, compute_topsis, compute_topsis_streaming, load_and_validate,
+    pyarrow, read_excel_cached, write_output,
+)
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    """The chunked three-pass path scores and ranks like compute_topsis."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.uniform(1, 100, (53, 4)), columns=['P1', 'P2', 'P3', 'P4'])
+    data.insert(0, 'Name', [f'M{i}' for i in range(len(data))])
+    input_path = tmp_path / 'input.csv'
+    output_path = tmp_path / 'output.csv'
+    data.to_csv(input_path, index=False)
+
+    # A chunk size that doesn't divide the row count exercises a partial last chunk
+    compute_topsis_streaming(str(input_path), '1,2,1,1', '+,-,+,-', str(output_path), chunk_rows=7)
+    streamed = pd.read_csv(output_path)
+
+    _, numerical_data, weights, benefit_mask = load_and_validate(str(input_path), '1,2,1,1', '+,-,+,-')
+    scores, ranks = compute_topsis(numerical_data, weights, benefit_mask)
+
+    assert list(streamed.columns) == list(data.columns) + ['Topsis Score', 'Rank']
+    np.testing.assert_allclose(streamed['Topsis Score'], _round_scores(scores), atol=1e-4)
+    np.testing.assert_array_equal(streamed['Rank'], ranks)
+
+
+def test_streaming_rejects_header_only_file(tmp_path):
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text('Name,P1,P2\n')
+
+    with pytest.raises(ValueError, match="contains no rows"):
+        compute_topsis_streaming(str(input_path), '1,1', '+,+', str(tmp_path / 'output.csv'))
+
+
+README_SAMPLE = """Fund Name,P1,P2,P3,P4,P5
+M1,0.84,0.71,6.7,42.1,12.59
+M2,0.91,0.83,7.0,31.7,10.11
+M3,0.79,0.62,4.8,46.7,13.23
+M4,0.78,0.61,6.4,42.4,12.55
+M5,0.94,0.88,3.6,62.2,16.91
+M6,0.88,0.77,6.5,51.5,14.91
+M7,0.66,0.44,5.3,48.9,13.83
+M8,0.93,0.86,3.4,37.0,10.55
+"""
+
+README_RESULT_ROWS = [
+    ('M1,0.84,0.71,6.7,42.1,12.59', '0.286,6'),
+    ('M2,0.91,0.83,7.0,31.7,10.11', '0.2852,7'),
+    ('M3,0.79,0.62,4.8,46.7,13.23', '0.5453,3'),
+    ('M4,0.78,0.61,6.4,42.4,12.55', '0.2646,8'),
+    ('M5,0.94,0.88,3.6,62.2,16.91', '0.958,1'),
+    ('M6,0.88,0.77,6.5,51.5,14.91', '0.4065,5'),
+    ('M7,0.66,0.44,5.3,48.9,13.83', '0.425,4'),
+    ('M8,0.93,0.86,3.4,37.0,10.55', '0.6651,2'),
+]
+
+
+@pytest.mark.parametrize('use_arrow', [True, False])
+def test_readme_sample_output_bytes(tmp_path, use_arrow):
+    """The README example writes exactly the documented bytes with either writer."""
+    if use_arrow:
+        pytest.importorskip('pyarrow')
+    input_path = tmp_path / 'data.csv'
+    output_path = tmp_path / 'result.csv'
+    input_path.write_text(README_SAMPLE)
+
+    data, numerical_data, weights, benefit_mask = load_and_validate(
+        str(input_path), '1,1,2,1,1', '+,+,-,+,+')
+    scores, ranks = compute_topsis(numerical_data, weights, benefit_mask)
+    data['Topsis Score'] = _round_scores(scores)
+    data['Rank'] = ranks
+    write_output(data, str(output_path), use_arrow=use_arrow)
+
+    rows = [f'{values},{results}' for values, results in README_RESULT_ROWS]
+    if use_arrow:
+        # Arrow drops the trailing '.0' of whole numbers
+        rows = [row.replace(',7.0,', ',7,').replace(',37.0,', ',37,') for row in rows]
+    expected = 'Fund Name,P1,P2,P3,P4,P5,Topsis Score,Rank\n' + '\n'.join(rows) + '\n'
+    assert output_path.read_bytes() == expected.encode()
+
+
+def test_arrow_writer_skipped_for_values_it_formats_differently():
+    plain = pd.DataFrame({'Name': ['M1', 'M2'], 'P1': [1.0, 7.0]})
+    assert arrow_csv_writable(plain) == (pyarrow is not None)
+    assert not arrow_csv_writable(plain.assign(Name=['M1', 'M,2']))
+    assert not arrow_csv_writable(plain.assign(Name=[True, False]))
+    assert not arrow_csv_writable(plain.assign(Name=pd.to_datetime(['2020-01-01', '2020-01-02'])))
+    assert not arrow_csv_writable(plain.assign(Name=['M1', 2]))
+
+
+def test_streaming_writes_one_format_when_a_later_chunk_needs_quoting(tmp_path):
+    """A name needing quotes in a later chunk switches the whole file to to_csv."""
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text('Name,P1,P2\nA,7.0,2.0\nB,3.0,4.0\n"C,x",2.0,5.0\nD,6.0,1.0\n')
+
+    streamed_path = tmp_path / 'streamed.csv'
+    compute_topsis_streaming(str(input_path), '1,1', '+,-', str(streamed_path), chunk_rows=2)
+
+    in_memory_path = tmp_path / 'in_memory.csv'
+    data, numerical_data, weights, benefit_mask = load_and_validate(str(input_path), '1,1', '+,-')
+    scores, ranks = compute_topsis(numerical_data, weights, benefit_mask)
+    data['Topsis Score'] = _round_scores(scores)
+    data['Rank'] = ranks
+    write_output(data, str(in_memory_path))
+
+    streamed = streamed_path.read_text()
+    assert streamed == in_memory_path.read_text()
+    assert streamed.splitlines()[1].startswith('A,7.0,2.0,')
+
+
+def test_infinite_criteria_values_are_rejected(tmp_path):
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text('Name,P1,P2\nA,1,2\nB,inf,3\nC,2,1e40\n')
+
+    with pytest.raises(ValueError, match=r"\['P1', 'P2'\] contain infinite values"):
+        load_and_validate(str(input_path), '1,1', '+,+')
+
+
+@pytest.mark.parametrize('n_cols', [3, 5, 7])
+@pytest.mark.parametrize('order', ['C', 'F'])
+def test_numba_kernel_matches_numpy_path(n_cols, order):
+    """The fused kernel, specialized per criteria count, agrees with the NumPy path."""
+    pytest.importorskip('numba')
+    rng = np.random.default_rng(n_cols)
+    numerical_data = np.asarray(rng.uniform(1, 100, (200, n_cols)), dtype=np.float32, order=order)
+    weights = rng.uniform(0.5, 2, n_cols).astype(np.float32)
+    weights[1] = -weights[1]
+    benefit_mask = np.arange(n_cols) % 2 == 0
+
+    kernel_scores = _load_topsis_kernel(n_cols)(numerical_data, weights, benefit_mask)
+    numpy_scores = _topsis_scores_vectorized(numerical_data, weights, benefit_mask)
+
+    np.testing.assert_allclose(kernel_scores, numpy_scores, rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(_rank_scores(kernel_scores), _rank_scores(numpy_scores))
+
+
+def test_excel_cache_round_trip_and_invalidation(tmp_path, monkeypatch):
+    """The Parquet cache is reused while fresh and rebuilt when stale or unreadable."""
+    pytest.importorskip('pyarrow')
+    pytest.importorskip('openpyxl')
+    workbook = tmp_path / 'data.xlsx'
+    cache = tmp_path / 'data.xlsx.parquet'
+    pd.DataFrame({'Name': ['a', 'b'], 2019: [1, 2], 2020: [3, 4]}).to_excel(workbook, index=False)
+
+    first = read_excel_cached(str(workbook))
+    assert cache.exists()
+
+    # A fresh cache is read without touching the workbook, keeping integer headers
+    real_read_excel = pd.read_excel
+    monkeypatch.setattr(pd, 'read_excel', lambda *args, **kwargs: pytest.fail("cache not used"))
+    second = read_excel_cached(str(workbook))
+    pd.testing.assert_frame_equal(second, first)
+    assert list(second.columns) == ['Name', 2019, 2020]
+    monkeypatch.setattr(pd, 'read_excel', real_read_excel)
+
+    # Replacing the workbook with an older-mtime copy still invalidates the cache
+    cache_mtime = os.stat(cache).st_mtime_ns
+    pd.DataFrame({'Name': ['a', 'b', 'c'], 2019: [9, 9, 9], 2020: [1, 2, 3]}).to_excel(workbook, index=False)
+    os.utime(workbook, ns=(cache_mtime - 10**9, cache_mtime - 10**9))
+    assert read_excel_cached(str(workbook))[2019].tolist() == [9, 9, 9]
+
+    # An unreadable cache is rebuilt
+    cache.write_bytes(b'not parquet')
+    assert read_excel_cached(str(workbook))[2019].tolist() == [9, 9, 9]
+    monkeypatch.setattr(pd, 'read_excel', lambda *args, **kwargs: pytest.fail("cache not rebuilt"))
+    assert read_excel_cached(str(workbook))[2019].tolist() == [9, 9, 9]